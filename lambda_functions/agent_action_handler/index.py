@@ -4,46 +4,140 @@ Bedrock Agent Action Group Lambda Handler.
 Handles API operations:
 - GET /check-spam/{phoneNumber} — Check if a phone number is spam (optional)
 - GET /caller-info/{phoneNumber} — Look up phone number information (optional)
+- GET /lookup/{phoneNumber} — Combined spam check + caller info (optional)
 - POST /call-record — Save call record to DynamoDB
+- POST /call-records/batch — Save multiple call records in batched writes
 - POST /notification — Send SNS notification
 """
 
 import json
 import os
-import uuid
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from secrets import token_hex
 
 import boto3
 
+# orjson serializes small dicts several times faster than stdlib json;
+# fall back to stdlib if the bundle was built without it
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
 # Environment variables
 TABLE_NAME = os.environ["CALL_RECORDS_TABLE"]
 TOPIC_ARN = os.environ["NOTIFICATION_TOPIC_ARN"]
 SPAM_DETECTION_ENABLED = os.environ.get("SPAM_DETECTION_ENABLED", "false").lower() == "true"
 
-# AWS clients
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+# AWS clients — low-level DynamoDB client skips the resource layer's
+# per-attribute Python serialization on every write
+ddb = boto3.client("dynamodb")
 sns_client = boto3.client("sns")
 
-# Conditionally import requests and set up secrets client
+# Small pool for running the independent SNS publish and DynamoDB write
+# in send_notification concurrently (boto3 clients are thread-safe)
+_executor = ThreadPoolExecutor(max_workers=2)
+
+# Conditionally import urllib3 and set up secrets client. urllib3 ships
+# with the runtime via botocore and imports far faster than requests
 if SPAM_DETECTION_ENABLED:
-    import requests
+    import urllib3
 
     SECRET_NAME = os.environ["NUMVERIFY_SECRET_NAME"]
     secrets_client = boto3.client("secretsmanager")
 
-# Cache the API key across invocations
-_numverify_api_key = None
+    # Shared pool so warm invocations reuse the keep-alive TLS connection
+    # to apilayer.net instead of paying a fresh handshake per call
+    _pool = urllib3.PoolManager(
+        num_pools=1,
+        maxsize=4,
+        timeout=urllib3.Timeout(connect=1.5, read=5),
+        retries=urllib3.Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+
+    # Fetch the API key during cold-start init so the request path only
+    # reads a module global; fall back to lazy retrieval if init fails
+    try:
+        NUMVERIFY_API_KEY = _loads(
+            secrets_client.get_secret_value(SecretId=SECRET_NAME)["SecretString"]
+        )["api_key"]
+    except Exception:
+        NUMVERIFY_API_KEY = None
+
+    # Prime DNS + TCP + TLS to NumVerify during init so the first lookup
+    # (and any SnapStart snapshot) starts from a warm connection; the
+    # keyless request is rejected by the API without consuming quota
+    try:
+        _pool.request(
+            "GET",
+            "https://apilayer.net/api/validate",
+            timeout=urllib3.Timeout(total=1),
+            retries=False,
+        )
+    except Exception:
+        pass
+else:
+    NUMVERIFY_API_KEY = None
 
 
 def get_numverify_api_key():
-    """Retrieve NumVerify API key from Secrets Manager (cached)."""
-    global _numverify_api_key
-    if _numverify_api_key is None:
+    """Return the NumVerify API key, fetching it if init-time retrieval failed."""
+    global NUMVERIFY_API_KEY
+    if NUMVERIFY_API_KEY is None:
         response = secrets_client.get_secret_value(SecretId=SECRET_NAME)
-        secret = json.loads(response["SecretString"])
-        _numverify_api_key = secret["api_key"]
-    return _numverify_api_key
+        NUMVERIFY_API_KEY = _loads(response["SecretString"])["api_key"]
+    return NUMVERIFY_API_KEY
+
+
+# NumVerify data for a number doesn't change mid-call; cache responses in
+# the warm container so a spam check followed by an info lookup for the
+# same caller costs one HTTP round trip instead of two
+_NUMVERIFY_CACHE_TTL = 600  # seconds
+_numverify_cache = {}
+
+
+def _fetch_numverify(phone_number: str) -> dict:
+    """Fetch raw NumVerify data for a phone number, with a TTL cache."""
+    now = time.monotonic()
+    cached = _numverify_cache.get(phone_number)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    params = {
+        "access_key": NUMVERIFY_API_KEY or get_numverify_api_key(),
+        "number": phone_number,
+        "format": 1,
+    }
+    response = _pool.request("GET", "https://apilayer.net/api/validate", fields=params)
+    if response.status >= 400:
+        raise urllib3.exceptions.HTTPError(f"NumVerify returned HTTP {response.status}")
+    data = _loads(response.data)
+
+    # NumVerify reports application errors (bad key, quota, rate limit)
+    # as HTTP 200 with success:false and no lookup fields; never cache
+    # those, or one transient error would stick for the full TTL
+    if data.get("success") is False or "valid" not in data:
+        return data
+
+    if len(_numverify_cache) >= 256:
+        _numverify_cache.clear()
+    _numverify_cache[phone_number] = (data, now + _NUMVERIFY_CACHE_TTL)
+    return data
 
 
 def check_spam(phone_number: str) -> dict:
@@ -58,19 +152,8 @@ def check_spam(phone_number: str) -> dict:
             "spam_reason": "spam_detection_disabled",
         }
 
-    api_key = get_numverify_api_key()
-    url = "http://apilayer.net/api/validate"
-    params = {
-        "access_key": api_key,
-        "number": phone_number,
-        "country_code": "",
-        "format": 1,
-    }
-
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _fetch_numverify(phone_number)
 
         is_valid = data.get("valid", False)
         line_type = data.get("line_type", "unknown")
@@ -94,7 +177,7 @@ def check_spam(phone_number: str) -> dict:
             "spam_reason": spam_reason,
         }
 
-    except requests.RequestException as e:
+    except (urllib3.exceptions.HTTPError, ValueError) as e:
         return {
             "is_spam": False,
             "is_valid": True,
@@ -116,18 +199,8 @@ def get_caller_info(phone_number: str) -> dict:
             "line_type": "unknown",
         }
 
-    api_key = get_numverify_api_key()
-    url = "http://apilayer.net/api/validate"
-    params = {
-        "access_key": api_key,
-        "number": phone_number,
-        "format": 1,
-    }
-
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _fetch_numverify(phone_number)
 
         return {
             "valid": data.get("valid", False),
@@ -137,7 +210,7 @@ def get_caller_info(phone_number: str) -> dict:
             "line_type": data.get("line_type", "unknown"),
         }
 
-    except requests.RequestException:
+    except (urllib3.exceptions.HTTPError, ValueError):
         return {
             "valid": False,
             "country_name": "unknown",
@@ -147,101 +220,220 @@ def get_caller_info(phone_number: str) -> dict:
         }
 
 
-def save_call_record(body: dict) -> dict:
+def lookup_number(phone_number: str) -> dict:
+    """Combined spam check and caller info lookup in one action.
+
+    Both projections come from the same cached NumVerify response, so
+    this costs a single API call.
+    """
+    return {
+        "spam": check_spam(phone_number),
+        "info": get_caller_info(phone_number),
+    }
+
+
+def _build_item(body: dict, notification_sent: bool = False) -> dict:
+    """Build a DynamoDB AttributeValue item for a call record."""
+    return {
+        "call_id": {"S": body.get("call_id") or token_hex(16)},
+        "timestamp": {"S": datetime.now(timezone.utc).isoformat()},
+        "caller_name": {"S": body["caller_name"]},
+        "caller_phone": {"S": body["caller_phone"]},
+        "reason": {"S": body["reason"]},
+        "is_spam": {"BOOL": bool(body.get("is_spam", False))},
+        "call_status": {"S": "spam_blocked" if body.get("is_spam") else "completed"},
+        "notification_sent": {"BOOL": notification_sent},
+    }
+
+
+def save_call_record(body: dict, notification_sent: bool = False) -> dict:
     """Save call record to DynamoDB."""
-    call_id = body.get("call_id", str(uuid.uuid4()))
-    timestamp = datetime.now(timezone.utc).isoformat()
+    item = _build_item(body, notification_sent)
 
-    item = {
-        "call_id": call_id,
-        "timestamp": timestamp,
-        "caller_name": body["caller_name"],
-        "caller_phone": body["caller_phone"],
-        "reason": body["reason"],
-        "is_spam": body.get("is_spam", False),
-        "call_status": "spam_blocked" if body.get("is_spam") else "completed",
-        "notification_sent": False,
+    ddb.put_item(TableName=TABLE_NAME, Item=item)
+
+    return {
+        "success": True,
+        "call_id": item["call_id"]["S"],
     }
 
-    table.put_item(Item=item)
+
+def save_call_records_batch(body: dict) -> dict:
+    """Save multiple call records using batched DynamoDB writes."""
+    records = body.get("records") or []
+    if isinstance(records, str):
+        records = _loads(records)
+
+    items = [_build_item(r) for r in records]
+
+    # BatchWriteItem accepts at most 25 items per call; re-submit any the
+    # service returns as unprocessed (throttling) after a short pause
+    for start in range(0, len(items), 25):
+        pending = [{"PutRequest": {"Item": item}} for item in items[start : start + 25]]
+        while pending:
+            response = ddb.batch_write_item(RequestItems={TABLE_NAME: pending})
+            pending = response.get("UnprocessedItems", {}).get(TABLE_NAME, [])
+            if pending:
+                time.sleep(0.2)
 
     return {
         "success": True,
-        "call_id": call_id,
+        "saved": len(items),
+        "call_ids": [item["call_id"]["S"] for item in items],
     }
 
 
+# Notification message template, built once at import
+_MSG_TMPL = (
+    "You have a new message from a caller.\n\n"
+    "--- Call Details ---\n"
+    "Caller Name: {name}\n"
+    "Phone Number: {phone}\n"
+    "Reason/Message: {reason}\n"
+    "Call ID: {call_id}\n"
+    "Time: {time}\n"
+    "---\n\n"
+    "This message was recorded by your automated caller agent."
+)
+
+
 def send_notification(body: dict) -> dict:
     """Send SNS notification with call details."""
     caller_name = body["caller_name"]
     caller_phone = body["caller_phone"]
     reason = body["reason"]
-    call_id = body.get("call_id", "unknown")
 
-    subject = f"Missed Call from {caller_name}"
-    message = (
-        f"You have a new message from a caller.\n\n"
-        f"--- Call Details ---\n"
-        f"Caller Name: {caller_name}\n"
-        f"Phone Number: {caller_phone}\n"
-        f"Reason/Message: {reason}\n"
-        f"Call ID: {call_id}\n"
-        f"Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-        f"---\n\n"
-        f"This message was recorded by your automated caller agent."
+    # Resolve the record id up front so the message, the saved record,
+    # and the response all carry the same id even when the agent omits it
+    provided_id = body.get("call_id")
+    call_id = provided_id or token_hex(16)
+    body["call_id"] = call_id
+
+    # Reuse the record's timestamp when the agent passes one; only format
+    # a fresh one when it doesn't. isoformat is C-implemented, unlike
+    # strftime's format-string parser; the slice drops the +00:00 offset
+    call_time = (
+        body.get("timestamp")
+        or datetime.now(timezone.utc).isoformat(sep=" ", timespec="seconds")[:19]
+        + " UTC"
     )
 
-    response = sns_client.publish(
-        TopicArn=TOPIC_ARN,
-        Subject=subject[:100],
-        Message=message,
+    subject = f"Missed Call from {caller_name}"
+    message = _MSG_TMPL.format(
+        name=caller_name,
+        phone=caller_phone,
+        reason=reason,
+        call_id=call_id,
+        time=call_time,
     )
 
-    # Update DynamoDB record to mark notification as sent
-    if call_id != "unknown":
-        try:
-            table.update_item(
-                Key={"call_id": call_id, "timestamp": body.get("timestamp", "")},
+    if body.get("save_record"):
+        # Fast path: one put_item instead of a put_item plus a later
+        # update_item. Publish first and persist only once it succeeds —
+        # racing the two could store notification_sent=True for a
+        # notification that was never delivered, and an agent retry
+        # would then write a duplicate record
+        response = sns_client.publish(
+            TopicArn=TOPIC_ARN,
+            Subject=subject[:100],
+            Message=message,
+        )
+        save_call_record(body, notification_sent=True)
+    else:
+        # The SNS publish and the notification_sent update are
+        # independent (the update's failure is swallowed either way), so
+        # run them concurrently and wait max(latency), not the sum
+        f_sns = _executor.submit(
+            sns_client.publish,
+            TopicArn=TOPIC_ARN,
+            Subject=subject[:100],
+            Message=message,
+        )
+
+        if provided_id:
+            # Update DynamoDB record to mark notification as sent
+            f_write = _executor.submit(
+                ddb.update_item,
+                TableName=TABLE_NAME,
+                Key={
+                    "call_id": {"S": call_id},
+                    "timestamp": {"S": body.get("timestamp", "")},
+                },
                 UpdateExpression="SET notification_sent = :val",
-                ExpressionAttributeValues={":val": True},
+                ExpressionAttributeValues={":val": {"BOOL": True}},
                 ConditionExpression="attribute_exists(call_id)",
+                ReturnValues="NONE",
+                ReturnConsumedCapacity="NONE",
             )
-        except Exception:
-            pass  # Non-critical; notification was already sent
+        else:
+            f_write = None
+
+        response = f_sns.result()
+
+        if f_write is not None:
+            try:
+                f_write.result()
+            except Exception:
+                pass  # Non-critical; notification was already sent
 
     return {
         "success": True,
         "message_id": response["MessageId"],
+        "call_id": call_id,
     }
 
 
+_TRUE_VALUES = frozenset(("true", "True"))
+_FALSE_VALUES = frozenset(("false", "False"))
+
+
 def extract_path_parameter(event: dict, param_name: str) -> str:
     """Extract a named parameter from the Bedrock Agent event."""
-    parameters = event.get("parameters", [])
-    for param in parameters:
-        if param["name"] == param_name:
-            return param["value"]
-    return ""
+    return next(
+        (p["value"] for p in event.get("parameters", ()) if p["name"] == param_name),
+        "",
+    )
 
 
 def extract_request_body(event: dict) -> dict:
     """Extract the request body from the Bedrock Agent event."""
-    request_body = event.get("requestBody", {})
-    content = request_body.get("content", {})
-    json_content = content.get("application/json", {})
-    properties = json_content.get("properties", [])
+    properties = (
+        event.get("requestBody", {})
+        .get("content", {})
+        .get("application/json", {})
+        .get("properties", ())
+    )
+
+    return {
+        p["name"]: (
+            True
+            if p["value"] in _TRUE_VALUES
+            else False
+            if p["value"] in _FALSE_VALUES
+            else p["value"]
+        )
+        for p in properties
+    }
 
-    body = {}
-    for prop in properties:
-        name = prop["name"]
-        value = prop["value"]
-        if value in ("true", "True"):
-            value = True
-        elif value in ("false", "False"):
-            value = False
-        body[name] = value
 
-    return body
+# Dispatch table keyed by (HTTP method, first path segment); each entry
+# takes the raw Bedrock event
+_ROUTES = {
+    ("GET", "check-spam"): lambda e: check_spam(
+        extract_path_parameter(e, "phoneNumber")
+    ),
+    ("GET", "caller-info"): lambda e: get_caller_info(
+        extract_path_parameter(e, "phoneNumber")
+    ),
+    ("GET", "lookup"): lambda e: lookup_number(
+        extract_path_parameter(e, "phoneNumber")
+    ),
+    ("POST", "call-record"): lambda e: save_call_record(extract_request_body(e)),
+    ("POST", "call-records"): lambda e: save_call_records_batch(
+        extract_request_body(e)
+    ),
+    ("POST", "notification"): lambda e: send_notification(extract_request_body(e)),
+}
 
 
 def lambda_handler(event, context):
@@ -249,28 +441,18 @@ def lambda_handler(event, context):
     api_path = event.get("apiPath", "")
     http_method = event.get("httpMethod", "").upper()
 
-    result = {}
-
-    if api_path.startswith("/check-spam/") and http_method == "GET":
-        phone_number = extract_path_parameter(event, "phoneNumber")
-        result = check_spam(phone_number)
-
-    elif api_path.startswith("/caller-info/") and http_method == "GET":
-        phone_number = extract_path_parameter(event, "phoneNumber")
-        result = get_caller_info(phone_number)
-
-    elif api_path == "/call-record" and http_method == "POST":
-        body = extract_request_body(event)
-        result = save_call_record(body)
-
-    elif api_path == "/notification" and http_method == "POST":
-        body = extract_request_body(event)
-        result = send_notification(body)
-
-    else:
-        result = {"error": f"Unknown action: {http_method} {api_path}"}
+    segment = api_path.split("/", 2)[1] if api_path.startswith("/") else ""
+    route = _ROUTES.get((http_method, segment))
+    result = (
+        route(event)
+        if route
+        else {"error": f"Unknown action: {http_method} {api_path}"}
+    )
 
-    # Format response for Bedrock Agent
+    # Format response for Bedrock Agent — built flat in one expression;
+    # `or {}` avoids allocating throwaway default dicts for .get().
+    # The inner body must stay a JSON-encoded string: the action-group
+    # contract rejects a raw dict under "application/json"
     return {
         "messageVersion": "1.0",
         "response": {
@@ -278,12 +460,8 @@ def lambda_handler(event, context):
             "apiPath": api_path,
             "httpMethod": http_method,
             "httpStatusCode": 200,
-            "responseBody": {
-                "application/json": {
-                    "body": json.dumps(result),
-                },
-            },
+            "responseBody": {"application/json": {"body": _dumps(result)}},
         },
-        "sessionAttributes": event.get("sessionAttributes", {}),
-        "promptSessionAttributes": event.get("promptSessionAttributes", {}),
+        "sessionAttributes": event.get("sessionAttributes") or {},
+        "promptSessionAttributes": event.get("promptSessionAttributes") or {},
     }
@@ -6,6 +6,7 @@ Lex V2 Bot, and Amazon Connect integration.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from aws_cdk import (
@@ -28,6 +29,12 @@ from constructs import Construct
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
+@lru_cache(maxsize=8)
+def _read(path: str) -> str:
+    """Read a config/schema file once per process (cached for cdk watch loops)."""
+    return Path(path).read_text(encoding="utf-8")
+
+
 class CallerAgentStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -106,8 +113,12 @@ class CallerAgentStack(Stack):
                     command=[
                         "bash",
                         "-c",
-                        "pip install -r requirements.txt -t /asset-output && "
-                        "cp -au . /asset-output",
+                        "pip install -r requirements.txt -t /asset-output --no-compile && "
+                        "cp -au . /asset-output && "
+                        "find /asset-output -type d "
+                        r"\( -name tests -o -name __pycache__ -o -name '*.dist-info' \) "
+                        "-prune -exec rm -rf {} + && "
+                        "find /asset-output -name '*.pyc' -delete",
                     ],
                 ),
             ),
@@ -118,8 +129,14 @@ class CallerAgentStack(Stack):
                 "NOTIFICATION_TOPIC_ARN": notification_topic.topic_arn,
                 "NUMVERIFY_SECRET_NAME": numverify_secret.secret_name,
             },
+            snap_start=_lambda.SnapStartConf.ON_PUBLISHED_VERSIONS,
         )
 
+        # SnapStart only applies to published versions, so Bedrock invokes
+        # a version whose snapshot captures the fully initialized module
+        # (clients, connection pool, API key) instead of $LATEST
+        handler_version = agent_action_handler.current_version
+
         call_records_table.grant_read_write_data(agent_action_handler)
         notification_topic.grant_publish(agent_action_handler)
         numverify_secret.grant_read(agent_action_handler)
@@ -150,13 +167,11 @@ class CallerAgentStack(Stack):
         # -------------------------------------------------------
         # 6. Bedrock Agent — Claude-powered conversation handler
         # -------------------------------------------------------
-        agent_instructions = (
-            PROJECT_ROOT / "config" / "agent_instructions.txt"
-        ).read_text(encoding="utf-8")
+        agent_instructions = _read(
+            str(PROJECT_ROOT / "config" / "agent_instructions.txt")
+        )
 
-        openapi_schema = (
-            PROJECT_ROOT / "schemas" / "openapi_schema.json"
-        ).read_text(encoding="utf-8")
+        openapi_schema = _read(str(PROJECT_ROOT / "schemas" / "openapi_schema.json"))
 
         caller_agent = bedrock.CfnAgent(
             self,
@@ -175,7 +190,7 @@ class CallerAgentStack(Stack):
                 bedrock.CfnAgent.AgentActionGroupProperty(
                     action_group_name="CallerManagementActions",
                     action_group_executor=bedrock.CfnAgent.ActionGroupExecutorProperty(
-                        lambda_=agent_action_handler.function_arn,
+                        lambda_=handler_version.function_arn,
                     ),
                     api_schema=bedrock.CfnAgent.APISchemaProperty(
                         payload=openapi_schema,
@@ -189,8 +204,8 @@ class CallerAgentStack(Stack):
             ],
         )
 
-        # Grant Bedrock permission to invoke the Lambda
-        agent_action_handler.add_permission(
+        # Grant Bedrock permission to invoke the published Lambda version
+        handler_version.add_permission(
             "AllowBedrockInvocation",
             principal=iam.ServicePrincipal("bedrock.amazonaws.com"),
             source_arn=caller_agent.attr_agent_arn,
@@ -385,9 +400,9 @@ class CallerAgentStack(Stack):
             # -------------------------------------------------------
             # 12. Amazon Connect Contact Flow
             # -------------------------------------------------------
-            contact_flow_content = (
-                PROJECT_ROOT / "config" / "contact_flow.json"
-            ).read_text(encoding="utf-8")
+            contact_flow_content = _read(
+                str(PROJECT_ROOT / "config" / "contact_flow.json")
+            )
 
             # Replace placeholder with actual Lex bot alias ARN
             contact_flow_content = contact_flow_content.replace(